@@ -5,24 +5,428 @@ This script creates a web interface for generating social media posts with capti
 It uses the Hugging Face Transformers library for text generation and sentiment analysis.
 """
 
+import asyncio
+import copy
+import os
+import re
+import string
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
 import gradio as gr
-from transformers import pipeline
-import random
+import nltk
+import numpy as np
+import torch
+from nltk.sentiment.vader import SentimentIntensityAnalyzer
+from transformers import (
+    AutoModelForCausalLM,
+    AutoModelForSequenceClassification,
+    AutoTokenizer,
+    GenerationConfig,
+    StoppingCriteria,
+    StoppingCriteriaList,
+    TextIteratorStreamer
+)
+from transformers.pytorch_utils import Conv1D
+
+def quantize_model(model):
+    """
+    Quantize a model's linear layers to int8 weights for faster CPU inference.
+    GPT-2 stores its projections as Conv1D (a transposed Linear), so those are converted first.
+    
+    Args:
+        model (torch.nn.Module): Model to quantize
+        
+    Returns:
+        torch.nn.Module: Copy of the model with dynamically quantized linear layers
+    """
+    # Work on a copy so the caller's model is left untouched
+    model = copy.deepcopy(model)
+    for module in list(model.modules()):
+        for name, child in list(module.named_children()):
+            if isinstance(child, Conv1D):
+                linear = torch.nn.Linear(child.weight.shape[0], child.nf)
+                linear.weight.data = child.weight.data.t().contiguous()
+                linear.bias.data = child.bias.data
+                setattr(module, name, linear)
+    return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+
+# Run int8 matrix multiplies through oneDNN, which uses VNNI/AVX-512 instructions where available
+if "onednn" in torch.backends.quantized.supported_engines:
+    torch.backends.quantized.engine = "onednn"
+
+# Run the models on the GPU in half precision when one is available.
+# int8 dynamic quantization only has CPU kernels, so it is applied on CPU only.
+DEVICE = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+DTYPE = torch.float16 if DEVICE.type == "cuda" else torch.float32
+
+# Set HIGH_ACCURACY=1 in the environment to classify caption sentiment with DistilBERT instead
+# of the word lexicon. The lexicon is far cheaper and good enough to pick between three emoji sets.
+HIGH_ACCURACY = os.environ.get("HIGH_ACCURACY") == "1"
+# Sentiment only needs the start of a caption, so the sentiment model reads at most this many
+# tokens and the lexicon scores at most this many words
+SENTIMENT_MAX_TOKENS = 64
+LEXICON_MAX_WORDS = 64
+# Sentiment analysis model to determine emotion in text (the default for "sentiment-analysis" pipelines)
+SENTIMENT_MODEL = "distilbert/distilbert-base-uncased-finetuned-sst-2-english"
+# Caption model: DistilGPT2 has 6 layers instead of GPT-2's 12, halving the compute and
+# key/value cache per token, and shares GPT-2's tokenizer
+CAPTION_MODEL = "distilgpt2"
+# Default caption budget in new tokens; captions also stop after this many sentences
+DEFAULT_NEW_TOKENS = 40
+MAX_SENTENCES = 2
+
+# Sampling settings built once, so generate() doesn't rebuild and validate them from kwargs per request
+CAPTION_CONFIG = GenerationConfig(
+    max_new_tokens=DEFAULT_NEW_TOKENS,
+    do_sample=True,           # Enable random sampling for diverse outputs
+    temperature=0.9,          # Controls randomness (higher = more random)
+    top_p=0.9,                # Nucleus sampling parameter
+    use_cache=True,           # Only feed the newest token through the model at each step
+    eos_token_id=50256,       # Stop at GPT-2's end-of-text token
+    pad_token_id=50256        # End-of-text also serves as padding
+)
+
+def load_caption_model():
+    """
+    Load the caption model for text generation, loaded directly so generate() can reuse prompt caches.
+    The model is quantized (on CPU), compiled and warmed up so the first request doesn't pay for compilation.
+    
+    Returns:
+        tuple: (tokenizer, model, sentence_end_ids) - The caption tokenizer, the optimized model
+            and the ids of tokens that end a sentence
+    """
+    tokenizer = AutoTokenizer.from_pretrained(CAPTION_MODEL)
+    # GPT-2 has no padding token, so reuse end-of-text
+    tokenizer.pad_token = tokenizer.eos_token
+    # Tokens whose text ends a sentence or line, e.g. ".", "!", " ?", "...", "\n"
+    token_texts = tokenizer.batch_decode([[token_id] for token_id in range(len(tokenizer))])
+    sentence_end_ids = torch.tensor([
+        token_id for token_id, text in enumerate(token_texts)
+        if text.rstrip(" ").endswith((".", "!", "?", "\n"))
+    ], device=DEVICE)
+    # SDPA routes attention through PyTorch's fused scaled-dot-product kernels
+    model = AutoModelForCausalLM.from_pretrained(
+        CAPTION_MODEL,
+        attn_implementation="sdpa",
+        torch_dtype=DTYPE
+    )
+    model = model.to(DEVICE).eval()
+    if DEVICE.type == "cpu":
+        model = quantize_model(model)
 
-# Initialize the machine learning models
-# GPT-2 model for text generation
-caption_generator = pipeline("text-generation", model="gpt2")
-# Sentiment analysis model to determine emotion in text
-sentiment_pipeline = pipeline("sentiment-analysis")
+    # Compile the forward pass and trigger compilation now rather than on the first click.
+    # dynamic=True avoids recompiling for every new prompt length and cache size.
+    eager_forward = model.forward
+    model.forward = torch.compile(model.forward, dynamic=True)
+    try:
+        with torch.no_grad():
+            model.generate(
+                **tokenizer("warmup", return_tensors="pt").to(DEVICE),
+                generation_config=CAPTION_CONFIG,
+                max_new_tokens=8
+            )
+    except Exception as e:
+        # Compilation needs a working compiler toolchain; fall back to eager mode without one
+        print(f"torch.compile unavailable, using eager mode: {e}")
+        model.forward = eager_forward
+    return tokenizer, model, sentence_end_ids
 
-# Dictionary mapping sentiment categories to relevant emojis
+def load_sentiment_model():
+    """
+    Load the sentiment analysis model used when HIGH_ACCURACY is enabled.
+    It's called directly rather than through a pipeline to skip the per-call pre/postprocessing glue.
+    
+    Returns:
+        tuple: (tokenizer, model) - The sentiment tokenizer and classifier, quantized when running on CPU
+    """
+    tokenizer = AutoTokenizer.from_pretrained(SENTIMENT_MODEL)
+    model = AutoModelForSequenceClassification.from_pretrained(SENTIMENT_MODEL, torch_dtype=DTYPE)
+    model = model.to(DEVICE).eval()
+    if DEVICE.type == "cpu":
+        model = quantize_model(model)
+    return tokenizer, model
+
+def load_sentiment_lexicon():
+    """
+    Load the VADER word lexicon, downloading it on first use.
+    
+    Returns:
+        dict: Mapping of lowercase words to signed sentiment scores
+    """
+    try:
+        return SentimentIntensityAnalyzer().lexicon
+    except LookupError:
+        nltk.download("vader_lexicon", quiet=True)
+        return SentimentIntensityAnalyzer().lexicon
+
+# Initialize the machine learning models and the sentiment lexicon in background threads so the
+# web server can start while they load (the lexicon may need a download). Handlers wait on these
+# futures when they first need a model or the lexicon.
+model_loader = ThreadPoolExecutor(max_workers=3)
+caption_future = model_loader.submit(load_caption_model)
+# Word lexicon used to score sentiment with a single pass over the text
+lexicon_future = model_loader.submit(load_sentiment_lexicon)
+if HIGH_ACCURACY:
+    sentiment_future = model_loader.submit(load_sentiment_model)
+
+# Relevant emojis for each sentiment category, stored in one contiguous array
 # Used to add contextual emojis based on the sentiment of generated text
-emoji_dict = {
-    "positive": ["😊", "🌟", "🔥", "💪", "🚀", "✨"],
-    "negative": ["😢", "😞", "💔", "😠", "😓"],
-    "neutral": ["🙂", "😐", "🧐", "🤔", "😶"]
+EMOJI_ARR = np.array([
+    "😊", "🌟", "🔥", "💪", "🚀", "✨",  # positive
+    "😢", "😞", "💔", "😠", "😓",        # negative
+    "🙂", "😐", "🧐", "🤔", "😶"         # neutral
+])
+# (start, count) of each sentiment's emojis within EMOJI_ARR
+SENT_RANGES = {
+    "positive": (0, 6),
+    "negative": (6, 5),
+    "neutral": (11, 5)
 }
 
+# Supported platforms; the interface passes the selected one as an index into this tuple
+PLATFORMS = ("Instagram", "LinkedIn", "Twitter")
+
+# Platform-specific hashtag suggestions, in the same order as PLATFORMS
+PLATFORM_TAGS = (
+    ("#instadaily", "#igers", "#picoftheday", "#instagood", "#photooftheday"),  # Instagram
+    ("#career", "#leadership", "#networking", "#business", "#success"),          # LinkedIn
+    ("#tweet", "#trending", "#news", "#viral", "#twitter")                       # Twitter
+)
+
+# Runs of 4+ word characters (letters, digits, underscore), the characters a hashtag may contain
+HASHTAG_WORD_RE = re.compile(r"\w{4,}")
+
+# Per-thread random generators, so concurrent requests don't contend for a shared lock
+rng_local = threading.local()
+
+def get_rng():
+    """
+    Get the calling thread's random number generator, creating it on first use.
+    
+    Returns:
+        np.random.Generator: PCG64 generator owned by this thread
+    """
+    rng = getattr(rng_local, "rng", None)
+    if rng is None:
+        rng = rng_local.rng = np.random.default_rng()
+    return rng
+
+def pick_two(pool):
+    """
+    Pick two distinct random items from the pool without building a sampled list.
+    
+    Args:
+        pool (tuple): Items to choose from, at least 2
+        
+    Returns:
+        tuple: Two distinct items
+    """
+    rng = get_rng()
+    i = rng.integers(len(pool))
+    # Draw from the remaining positions and skip over i
+    j = rng.integers(len(pool) - 1)
+    j += j >= i
+    return pool[i], pool[j]
+
+class LRUCache:
+    """
+    Small thread-safe cache that evicts the least recently used entry when full.
+
+    Args:
+        maxsize (int): Maximum number of entries to keep
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached value for key (marking it as recently used), or None."""
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def put(self, key, value):
+        """Store value under key, evicting the oldest entry if the cache is full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+# Prefill key/value tensors for recently used prompts, keyed by token ids.
+# Each entry costs 2 * layers * hidden_size * prompt_length floats, so keep the cache small.
+prompt_cache = LRUCache(maxsize=32)
+
+class SentenceEndCriteria(StoppingCriteria):
+    """
+    Stop generating once the new text contains a given number of sentence endings.
+
+    Args:
+        sentence_end_ids (torch.Tensor): Ids of tokens that end a sentence
+        prompt_length (int): Number of prompt tokens, which are not counted
+        max_sentences (int): Number of sentence endings to stop after
+    """
+
+    def __init__(self, sentence_end_ids, prompt_length, max_sentences=MAX_SENTENCES):
+        self.sentence_end_ids = sentence_end_ids
+        self.prompt_length = prompt_length
+        self.max_sentences = max_sentences
+
+    def __call__(self, input_ids, scores, **kwargs):
+        new_ids = input_ids[:, self.prompt_length:]
+        return torch.isin(new_ids, self.sentence_end_ids).sum(dim=1) >= self.max_sentences
+
+class StopEventCriteria(StoppingCriteria):
+    """
+    Stop generating once an event is set, e.g. when the request that started generation is cancelled.
+
+    Args:
+        stop_event (threading.Event): Event checked after every generated token
+    """
+
+    def __init__(self, stop_event):
+        self.stop_event = stop_event
+
+    def __call__(self, input_ids, scores, **kwargs):
+        return torch.full(
+            (input_ids.shape[0],),
+            self.stop_event.is_set(),
+            dtype=torch.bool,
+            device=input_ids.device
+        )
+
+def get_prompt_cache(model, input_ids):
+    """
+    Get the key/value cache for all prompt tokens except the last one.
+    The last token is left for generate() so it still produces the first new token's logits.
+    
+    Args:
+        model (torch.nn.Module): Caption model that produces the cache
+        input_ids (torch.Tensor): Prompt token ids with shape (1, seq_len), seq_len > 1
+        
+    Returns:
+        Key/value cache that generate() can extend without touching the cached copy
+    """
+    prefix_ids = input_ids[:, :-1]
+    key = tuple(prefix_ids[0].tolist())
+    past_key_values = prompt_cache.get(key)
+    if past_key_values is None:
+        # Cache miss: run the prefill pass once and keep its key/value tensors
+        with torch.no_grad():
+            past_key_values = model(prefix_ids, use_cache=True).past_key_values
+        prompt_cache.put(key, past_key_values)
+    # generate() appends to the cache in place, so hand it a private copy
+    return copy.deepcopy(past_key_values)
+
+def generate_caption(prompt, max_new_tokens=DEFAULT_NEW_TOKENS, streamer=None, stop_event=None):
+    """
+    Generate a caption that continues the prompt, reusing cached prefill work when possible.
+    Generation stops early once the caption has MAX_SENTENCES complete sentences.
+    
+    Args:
+        prompt (str): User's input text or theme
+        max_new_tokens (int): Maximum number of tokens to generate after the prompt
+        streamer (TextIteratorStreamer, optional): Receives the new text as it's generated
+        stop_event (threading.Event, optional): Ends generation early when set
+        
+    Returns:
+        str: The prompt followed by the generated text, with surrounding whitespace trimmed
+    """
+    # Blocks until the model has finished loading
+    caption_tokenizer, caption_model, sentence_end_ids = caption_future.result()
+    inputs = caption_tokenizer(prompt, return_tensors="pt").to(DEVICE)
+    input_ids = inputs["input_ids"]
+    cache_kwargs = {}
+    if input_ids.shape[1] > 1:
+        cache_kwargs["past_key_values"] = get_prompt_cache(caption_model, input_ids)
+    stopping_criteria = StoppingCriteriaList([SentenceEndCriteria(sentence_end_ids, input_ids.shape[1])])
+    if stop_event is not None:
+        stopping_criteria.append(StopEventCriteria(stop_event))
+
+    with torch.no_grad():
+        output_ids = caption_model.generate(
+            input_ids,
+            attention_mask=inputs["attention_mask"],
+            generation_config=CAPTION_CONFIG,
+            max_new_tokens=max_new_tokens,  # Number of decode steps, independent of prompt length
+            stopping_criteria=stopping_criteria,
+            streamer=streamer,
+            **cache_kwargs
+        )
+    return caption_tokenizer.decode(output_ids[0], skip_special_tokens=True).strip()
+
+def lexicon_sentiment(text):
+    """
+    Classify the sentiment of the text by summing lexicon scores of its words.
+    
+    Args:
+        text (str): Input text to analyze for sentiment
+        
+    Returns:
+        str: "positive", "negative" or "neutral"
+    """
+    # Blocks until the lexicon has finished loading
+    sentiment_lexicon = lexicon_future.result()
+    words = islice(text.lower().split(), LEXICON_MAX_WORDS)
+    score = sum(sentiment_lexicon.get(word.strip(string.punctuation), 0) for word in words)
+    if score > 0:
+        return "positive"
+    if score < 0:
+        return "negative"
+    return "neutral"
+
+# Model sentiment labels keyed by the opening words of a caption, which largely decide its tone
+SENTIMENT_PREFIX_WORDS = 20
+sentiment_cache = LRUCache(maxsize=1024)
+
+def model_sentiment(text):
+    """
+    Classify the sentiment of the text with the sentiment model, reusing cached labels.
+    Only the first SENTIMENT_PREFIX_WORDS words are analyzed and used as the cache key.
+    
+    Args:
+        text (str): Input text to analyze for sentiment
+        
+    Returns:
+        str: Lowercase sentiment label
+    """
+    prefix = " ".join(text.split()[:SENTIMENT_PREFIX_WORDS])
+    label = sentiment_cache.get(prefix)
+    if label is None:
+        # Cache miss: run the sentiment model; truncating cuts the quadratic attention cost
+        sentiment_tokenizer, sentiment_model = sentiment_future.result()
+        inputs = sentiment_tokenizer(
+            prefix,
+            truncation=True,
+            max_length=SENTIMENT_MAX_TOKENS,
+            return_tensors="pt"
+        ).to(DEVICE)
+        with torch.no_grad():
+            label_id = sentiment_model(**inputs).logits.argmax(dim=-1).item()
+        label = sentiment_model.config.id2label[label_id].lower()
+        sentiment_cache.put(prefix, label)
+    return label
+
+def pick_emojis(label):
+    """
+    Pick 3 distinct random emojis for a sentiment.
+    
+    Args:
+        label (str): Sentiment label (positive/negative/neutral)
+        
+    Returns:
+        str: String of 3 emojis
+    """
+    start, count = SENT_RANGES[label]
+    return ''.join(EMOJI_ARR[start + get_rng().choice(count, 3, replace=False)])
+
 def get_emojis(text):
     """
     Generate relevant emojis based on the sentiment of the input text.
@@ -35,76 +439,98 @@ def get_emojis(text):
     """
     try:
         # Get sentiment label (positive/negative/neutral)
-        label = sentiment_pipeline(text)[0]['label'].lower()
+        if HIGH_ACCURACY:
+            label = model_sentiment(text)
+        else:
+            label = lexicon_sentiment(text)
         # Return 3 random emojis matching the sentiment
-        return ''.join(random.sample(emoji_dict.get(label, ["😐"]), 3))
+        return pick_emojis(label)
     except Exception as e:
         # Default to happy emojis if there's an error in sentiment analysis
         print(f"Error in sentiment analysis: {e}")
         return "😊😊😊"
 
-def get_hashtags(prompt, platform):
+def get_hashtags(prompt, platform_idx):
     """
     Generate relevant hashtags based on the input prompt and selected platform.
     
     Args:
         prompt (str): User's input text
-        platform (str): Selected social media platform
+        platform_idx (int): Index of the selected social media platform in PLATFORMS
         
     Returns:
         str: String of generated hashtags
     """
-    # Extract words longer than 3 characters from the prompt
-    words = prompt.lower().split()
-    tags = ["#" + word.replace(" ", "") for word in words if len(word) > 3]
+    # Extract the first 5 words longer than 3 characters from the prompt,
+    # stopping the scan as soon as enough have been found
+    words = HASHTAG_WORD_RE.finditer(prompt.lower())
+    tags = ["#" + match.group() for match in islice(words, 5)]
 
-    # Platform-specific hashtag suggestions
-    platform_tags = {
-        "Instagram": ["#instadaily", "#igers", "#picoftheday", "#instagood", "#photooftheday"],
-        "LinkedIn": ["#career", "#leadership", "#networking", "#business", "#success"],
-        "Twitter": ["#tweet", "#trending", "#news", "#viral", "#twitter"]
-    }
-    
     # Combine 5 most relevant hashtags from prompt with 2 platform-specific ones
-    return " ".join(tags[:5] + random.sample(platform_tags[platform], 2))
+    tags.extend(pick_two(PLATFORM_TAGS[platform_idx]))
+    return " ".join(tags)
 
-def generate_post(prompt, platform):
+async def generate_post(prompt, platform_idx, max_new_tokens=DEFAULT_NEW_TOKENS):
     """
     Generate a complete social media post including caption, emojis, and hashtags.
+    The caption is streamed as it's generated; emojis and hashtags follow once it's complete.
     
     Args:
         prompt (str): User's input text or theme
-        platform (str): Selected social media platform
+        platform_idx (int): Index of the selected social media platform in PLATFORMS
+        max_new_tokens (int): Maximum caption length in tokens, excluding the prompt
         
-    Returns:
-        tuple: (caption, emojis, hashtags) - The generated post components
+    Yields:
+        tuple: (caption, emojis, hashtags) - The post components generated so far
     """
     # Validate input
     if not prompt.strip():
-        return "Please enter a keyword or theme", "", ""
+        yield "Please enter a keyword or theme", "", ""
+        return
     
     try:
-        # Generate caption using GPT-2 model
-        caption = caption_generator(
-            prompt,                    # Input prompt
-            max_length=100,           # Maximum length of generated text
-            num_return_sequences=1,    # Number of captions to generate
-            do_sample=True,           # Enable random sampling for diverse outputs
-            temperature=0.9,          # Controls randomness (higher = more random)
-            top_p=0.9                 # Nucleus sampling parameter
-        )[0]['generated_text']
+        # Generate caption using the DistilGPT2 model in a worker thread, reading new text from the streamer.
+        # Model calls and blocking reads run off the event loop so other requests keep being served.
+        caption_tokenizer, _, _ = await asyncio.wrap_future(caption_future)
+        streamer = TextIteratorStreamer(caption_tokenizer, skip_prompt=True, skip_special_tokens=True)
+        stop_event = threading.Event()
+
+        def run_generation():
+            try:
+                return generate_caption(prompt, int(max_new_tokens), streamer=streamer, stop_event=stop_event)
+            except Exception:
+                # Unblock the loop below, which would otherwise wait for more text forever
+                streamer.end()
+                raise
+
+        generation = asyncio.create_task(asyncio.to_thread(run_generation))
+        try:
+            caption = prompt
+            while True:
+                text = await asyncio.to_thread(next, streamer, None)
+                if text is None:
+                    break
+                caption += text
+                yield caption, "", ""
+            caption = await generation
+        finally:
+            # If the handler was cancelled (e.g. the client disconnected) or the read failed,
+            # end generate() at the next token and drop its result instead of leaving it running
+            stop_event.set()
+            if not generation.done():
+                generation.cancel()
 
         # Generate relevant emojis based on caption sentiment
-        emojis = get_emojis(caption)
+        emojis = await asyncio.to_thread(get_emojis, caption)
 
         # Generate platform-appropriate hashtags
-        hashtags = get_hashtags(prompt, platform)
+        hashtags = get_hashtags(prompt, platform_idx)
 
-        return caption.strip(), emojis, hashtags
+        yield caption, emojis, hashtags
         
     except Exception as e:
         print(f"Error generating post: {e}")
-        return "An error occurred while generating the post. Please try again.", "", ""
+        yield "An error occurred while generating the post. Please try again.", "", ""
 
 # Custom CSS for enhancing the web interface
 # This CSS customizes the appearance of the Gradio UI components
@@ -161,10 +587,18 @@ with gr.Blocks(css=custom_css, theme=gr.themes.Soft()) as demo:
                     lines=2
                 )
                 platform = gr.Radio(
-                    ["Instagram", "LinkedIn", "Twitter"],
+                    list(PLATFORMS),
+                    type="index",  # Pass the handler an index into PLATFORM_TAGS
                     label="📱 Select Platform",
                     value="Instagram"
                 )
+                max_tokens = gr.Slider(
+                    minimum=10,
+                    maximum=100,
+                    value=DEFAULT_NEW_TOKENS,
+                    step=5,
+                    label="📏 Max caption length (tokens)"
+                )
                 
                 generate_btn = gr.Button("✨ Generate Post", variant="primary")
                 
@@ -204,7 +638,7 @@ with gr.Blocks(css=custom_css, theme=gr.themes.Soft()) as demo:
     # Connect the button
     generate_btn.click(
         fn=generate_post,
-        inputs=[input_text, platform],
+        inputs=[input_text, platform, max_tokens],
         outputs=[output_caption, output_emojis, output_hashtags]
     )
     
@@ -219,17 +653,15 @@ with gr.Blocks(css=custom_css, theme=gr.themes.Soft()) as demo:
     )
     
     # Copy button functionality
-    def copy_to_clipboard(caption, emojis, hashtags):
-        import pyperclip
-        full_text = f"{caption}\n\n{emojis}\n\n{hashtags}"
-        pyperclip.copy(full_text)
-        return "Copied to clipboard!"
-    
-    copy_output = gr.Textbox(visible=False)
+    # Runs in the browser so the text lands on the user's clipboard, not the server's
     copy_btn.click(
-        fn=copy_to_clipboard,
+        fn=None,
         inputs=[output_caption, output_emojis, output_hashtags],
-        outputs=copy_output
+        outputs=None,
+        js="""(caption, emojis, hashtags) => {
+            navigator.clipboard.writeText(`${caption}\n\n${emojis}\n\n${hashtags}`);
+            return [];
+        }"""
     )
 
 # Main entry point for the application
@@ -237,4 +669,6 @@ if __name__ == "__main__":
     # Start the web server and make the interface publicly accessible
     # Set share=True to create a public link (useful for sharing)
     # For production, you might want to set share=False and configure proper hosting
+    # Run up to 4 generations at once; PyTorch releases the GIL inside its kernels
+    demo.queue(default_concurrency_limit=4, max_size=64)
     demo.launch(share=True)
\ No newline at end of file